@@ -10,6 +10,8 @@ All other exceptions are subclassed from :class:`.ClientException`.
 
 from __future__ import annotations
 
+import sys
+
 
 class PRAWException(Exception):  # noqa: N818
     """The base PRAW Exception that all other exception classes extend."""
@@ -18,6 +20,8 @@ class PRAWException(Exception):  # noqa: N818
 class RedditErrorItem:
     """Represents a single error returned from Reddit's API."""
 
+    __slots__ = ("error_type", "field", "message")
+
     @property
     def error_message(self) -> str:
         """Get the completed error message string."""
@@ -38,6 +42,10 @@ class RedditErrorItem:
             )
         return super().__eq__(other)
 
+    def __getstate__(self) -> tuple[str, str | None, str | None]:
+        """Return the error type, field, and message as a tuple for pickling."""
+        return self.error_type, self.field, self.message
+
     def __hash__(self) -> int:
         """Return the hash of the current instance."""
         return hash(self.__class__.__name__) ^ hash((self.error_type, self.message, self.field))
@@ -56,9 +64,9 @@ class RedditErrorItem:
         :param message: The associated message for the error.
 
         """
-        self.error_type = error_type
+        self.error_type = sys.intern(error_type)
         self.message = message
-        self.field = field
+        self.field = sys.intern(field) if field else field
 
     def __repr__(self) -> str:
         """Return an object initialization representation of the instance."""
@@ -66,6 +74,11 @@ class RedditErrorItem:
             f"{self.__class__.__name__}(error_type={self.error_type!r}, message={self.message!r}, field={self.field!r})"
         )
 
+    def __setstate__(self, state: tuple[str, str | None, str | None]) -> None:
+        """Restore the error type, field, and message from a pickled tuple."""
+        error_type, field, message = state
+        self.__init__(error_type, field=field, message=message)
+
     def __str__(self) -> str:
         """Get the message returned from str(self)."""
         return self.error_message
@@ -114,8 +114,7 @@ class CommentForest:
 
     def _update(self, comments: list[praw.models.Comment]) -> None:
         self._comments = comments
-        for comment in comments:
-            comment.submission = self._submission
+        self._submission._bulk_register(comments)
 
     def replace_more(self, *, limit: int | None = 32, threshold: int = 0) -> list[praw.models.MoreComments]:
         """Update the comment forest by resolving instances of :class:`.MoreComments`.
@@ -97,7 +97,9 @@ class ListingGenerator(PRAWBase, Iterator):
         if not self._listing:
             raise StopIteration
 
-        if self._listing.after and self._listing.after != self.params.get(self._listing.AFTER_PARAM):
-            self.params[self._listing.AFTER_PARAM] = self._listing.after
+        after = self._listing.after
+        after_param = self._listing.AFTER_PARAM
+        if after and after != self.params.get(after_param):
+            self.params[after_param] = after
         else:
             self._exhausted = True
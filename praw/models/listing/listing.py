@@ -14,6 +14,7 @@ class Listing(PRAWBase):
     """A listing is a collection of :class:`.RedditBase` instances."""
 
     if TYPE_CHECKING:
+        _children: list[Any]
         after: Any
 
     AFTER_PARAM = "after"
@@ -21,16 +22,18 @@ class Listing(PRAWBase):
 
     def __getitem__(self, index: int) -> Any:
         """Return the item at position index in the list."""
-        return getattr(self, self.CHILD_ATTRIBUTE)[index]
+        return self._children[index]
 
     def __len__(self) -> int:
         """Return the number of items in the Listing."""
-        return len(getattr(self, self.CHILD_ATTRIBUTE))
+        return len(self._children)
 
     def __setattr__(self, attribute: str, value: Any) -> None:
         """Objectify the ``CHILD_ATTRIBUTE`` attribute."""
         if attribute == self.CHILD_ATTRIBUTE:
             value = self._reddit._objector.objectify(data=value)
+            # Keep a direct reference so item access skips the dynamic lookup
+            super().__setattr__("_children", value)
         super().__setattr__(attribute, value)
 
 
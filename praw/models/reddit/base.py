@@ -16,6 +16,16 @@ if TYPE_CHECKING:
 class RedditBase(PRAWBase):
     """Base class that represents actual Reddit objects."""
 
+    @property
+    def _str_lower(self) -> str:
+        """Return the lowercased ``STR_FIELD`` value used for equality and hashing.
+
+        Subclasses whose ``STR_FIELD`` value never changes can cache it with
+        ``_str_lower = cachedproperty(RedditBase._str_lower.fget)``.
+
+        """
+        return str(self).lower()
+
     @staticmethod
     def _url_parts(url: str) -> list[str]:
         parsed = urlparse(url)
@@ -26,8 +36,8 @@ class RedditBase(PRAWBase):
     def __eq__(self, other: Any | str) -> bool:
         """Return whether the other instance equals the current."""
         if isinstance(other, str):
-            return other.lower() == str(self).lower()
-        return isinstance(other, self.__class__) and str(self).lower() == str(other).lower()
+            return other.lower() == self._str_lower
+        return isinstance(other, self.__class__) and self._str_lower == other._str_lower
 
     def __getattr__(self, attribute: str) -> Any:
         """Return the value of ``attribute``."""
@@ -39,7 +49,7 @@ class RedditBase(PRAWBase):
 
     def __hash__(self) -> int:
         """Return the hash of the current instance."""
-        return hash(self.__class__.__name__) ^ hash(str(self).lower())
+        return hash(self.__class__.__name__) ^ hash(self._str_lower)
 
     def __init__(
         self,
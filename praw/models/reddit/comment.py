@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 from praw.const import API_PATH
@@ -13,9 +15,25 @@ from praw.models.reddit.redditor import Redditor
 from praw.util.cache import cachedproperty
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import praw.models
 
 
+@lru_cache(maxsize=1024)
+def _id_from_url(url: str) -> str:
+    # Only successful parses are cached; lru_cache does not store raised exceptions.
+    parts = RedditBase._url_parts(url)
+    try:
+        comment_index = parts.index("comments")
+    except ValueError:
+        raise InvalidURL(url) from None
+
+    if len(parts) - 4 != comment_index:
+        raise InvalidURL(url)
+    return parts[-1]
+
+
 class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
     """A class that represents a Reddit comment.
 
@@ -60,18 +78,16 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
     MISSING_COMMENT_MESSAGE = "This comment does not appear to be in the comment tree"
     STR_FIELD = "id"
 
+    # The context limit appears to be 8, but let's ask for more anyway. Shared between
+    # calls to :meth:`.refresh`; it must be copied before being modified.
+    _DEFAULT_REFRESH_PARAMS = {"context": 100}  # noqa: RUF012
+
+    _str_lower = cachedproperty(RedditBase._str_lower.fget)
+
     @staticmethod
     def id_from_url(url: str) -> str:
         """Get the ID of a comment from the full URL."""
-        parts = RedditBase._url_parts(url)
-        try:
-            comment_index = parts.index("comments")
-        except ValueError:
-            raise InvalidURL(url) from None
-
-        if len(parts) - 4 != comment_index:
-            raise InvalidURL(url)
-        return parts[-1]
+        return _id_from_url(url)
 
     @cachedproperty
     def mod(self) -> praw.models.reddit.comment.CommentModeration:
@@ -95,10 +111,10 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
     @property
     def is_root(self) -> bool:
         """Return ``True`` when the comment is a top-level comment."""
-        parent_type = self.parent_id.split("_", 1)[0]
+        parent_type = self.parent_id.partition("_")[0]
         return parent_type == self._reddit.config.kinds["submission"]
 
-    @property
+    @cachedproperty
     def replies(self) -> CommentForest:
         """Provide an instance of :class:`.CommentForest`.
 
@@ -121,9 +137,7 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
             ``"controversial"``, ``"new"``, ``"old"``, ``"q&a"``, and ``"top"``.
 
         """
-        if isinstance(self._replies, list):
-            self._replies = CommentForest(self.submission, self._replies)
-        return self._replies
+        return CommentForest(self.submission, self._replies)
 
     @property
     def submission(self) -> praw.models.Submission:
@@ -135,10 +149,7 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
     @submission.setter
     def submission(self, submission: praw.models.Submission) -> None:
         """Update the :class:`.Submission` associated with the :class:`.Comment`."""
-        submission._comments_by_id[self.fullname] = self
-        self._submission = submission
-        for reply in getattr(self, "replies", []):
-            reply.submission = submission
+        submission._bulk_register([self])
 
     def __init__(
         self,
@@ -148,7 +159,7 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
         _data: dict[str, Any] | None = None,
     ) -> None:
         """Initialize a :class:`.Comment` instance."""
-        if sum(1 for value in (id, url, _data) if value is not None) != 1:
+        if (id is not None) + (url is not None) + (_data is not None) != 1:
             msg = "Exactly one of 'id', 'url', or '_data' must be provided."
             raise TypeError(msg)
         fetched = False
@@ -173,14 +184,32 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
         elif attribute == "replies":
             value = [] if value == "" else self._reddit._objector.objectify(data=value).children  # noqa: PLC1901
             attribute = "_replies"
+            self.__dict__.pop("replies", None)  # Drop any cached CommentForest
         elif attribute == "subreddit":
             value = self._reddit.subreddit(value)
         super().__setattr__(attribute, value)
 
+    @staticmethod
+    def _iter_comment_tree(
+        comments: list[Comment | praw.models.MoreComments],
+    ) -> Iterator[Comment | praw.models.MoreComments]:
+        """Yield the comments of a tree depth-first without recursion.
+
+        Replies are only pushed onto the stack once their parent has been yielded, so
+        a consumer that stops early never visits the remaining subtrees.
+
+        """
+        stack = list(comments)
+        while stack:
+            comment = stack.pop()
+            yield comment
+            if isinstance(comment, Comment):
+                stack.extend(comment._replies)
+
     def _extract_submission_id(self) -> str:
         if "context" in self.__dict__:
             return self.context.rsplit("/", 4)[1]
-        return self.link_id.split("_", 1)[1]
+        return self.link_id.partition("_")[2]
 
     def _fetch(self) -> None:
         data = self._fetch_data()
@@ -190,9 +219,8 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
             msg = f"No data returned for comment {self.fullname}"
             raise ClientException(msg)
 
-        comment_data = data["children"][0]["data"]
-        other = type(self)(self._reddit, _data=comment_data)
-        self.__dict__.update(other.__dict__)
+        for attribute, value in data["children"][0]["data"].items():
+            setattr(self, attribute, value)
         super()._fetch()
 
     def _fetch_info(self) -> tuple[str, dict, dict[str, str]]:
@@ -250,15 +278,18 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
         to :meth:`.refresh` it would make at least 31 network requests.
 
         """
-        if self.parent_id == self.submission.fullname:
-            return self.submission
+        parent_id = self.parent_id
+        submission = self._submission or self.submission
+        if parent_id == submission.fullname:
+            return submission
 
-        if self.parent_id in self.submission._comments_by_id:
+        parent = submission._comments_by_id.get(parent_id)
+        if parent is not None:
             # The Comment already exists, so simply return it
-            return self.submission._comments_by_id[self.parent_id]
+            return parent
 
-        parent = Comment(self._reddit, self.parent_id.split("_", 1)[1])
-        parent._submission = self.submission
+        parent = Comment(self._reddit, parent_id.partition("_")[2])
+        parent._submission = submission
         return parent
 
     def refresh(self) -> Comment:
@@ -276,38 +307,36 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
 
         """
         if "context" in self.__dict__:  # Using hasattr triggers a fetch
-            comment_path = self.context.split("?", 1)[0]
+            comment_path = self.context.partition("?")[0]
         else:
             path = API_PATH["submission"].format(id=self.submission.id)
             comment_path = f"{path}_/{self.id}"
 
-        # The context limit appears to be 8, but let's ask for more anyway.
-        params = {"context": 100}
-        if "reply_limit" in self.__dict__:
-            params["limit"] = self.reply_limit
-        if "reply_sort" in self.__dict__:
-            params["sort"] = self.reply_sort
+        params = self._DEFAULT_REFRESH_PARAMS
+        if "reply_limit" in self.__dict__ or "reply_sort" in self.__dict__:
+            params = params.copy()
+            if "reply_limit" in self.__dict__:
+                params["limit"] = self.reply_limit
+            if "reply_sort" in self.__dict__:
+                params["sort"] = self.reply_sort
         comment_list = self._reddit.get(comment_path, params=params)[1].children
         if not comment_list:
             raise ClientException(self.MISSING_COMMENT_MESSAGE)
 
-        # With context, the comment may be nested so we have to find it
-        comment = None
-        queue = comment_list[:]
-        while queue and (comment is None or comment.id != self.id):
-            comment = queue.pop()
-            if isinstance(comment, Comment):
-                queue.extend(comment._replies)
-
-        if comment.id != self.id:
+        # With context, the comment may be nested so we have to find it. Check the
+        # top-level comments first, as that avoids walking any replies.
+        for comment in chain(comment_list, self._iter_comment_tree(comment_list)):
+            if comment.id == self.id:
+                break
+        else:
             raise ClientException(self.MISSING_COMMENT_MESSAGE)
 
         if self._submission is not None:
             del comment.__dict__["_submission"]  # Don't replace if set
+        self.__dict__.pop("replies", None)  # Drop any CommentForest cached before refresh
         self.__dict__.update(comment.__dict__)
 
-        for reply in comment_list:
-            reply.submission = self.submission
+        self.submission._bulk_register(comment_list)
         return self
 
 
@@ -64,4 +64,5 @@ class EditableMixin:
             if attribute in updated.__dict__:
                 delattr(updated, attribute)
         self.__dict__.update(updated.__dict__)
+        self.__dict__.pop("replies", None)  # Drop any cached CommentForest
         return self
@@ -53,8 +53,7 @@ class MoreComments(PRAWBase):
         parent = self._load_comment(self.parent_id.split("_", 1)[1])
         self._comments = parent.replies
         if update:
-            for comment in self._comments:
-                comment.submission = self.submission
+            self.submission._bulk_register(self._comments)
         return self._comments
 
     def _load_comment(self, comment_id: str) -> praw.models.Comment:
@@ -82,6 +81,5 @@ class MoreComments(PRAWBase):
             }
             self._comments = self._reddit.post(API_PATH["morechildren"], data=data)
             if update:
-                for comment in self._comments:
-                    comment.submission = self.submission
+                self.submission._bulk_register(self._comments)
         return self._comments
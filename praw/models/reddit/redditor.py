@@ -18,6 +18,20 @@ if TYPE_CHECKING:
     import praw.models
 
 
+_UserSubreddit = None
+
+
+def _user_subreddit_class() -> type[praw.models.reddit.user_subreddit.UserSubreddit]:
+    # Imported lazily to avoid a circular import, then kept at module scope so that
+    # objectifying a redditor's subreddit does not re-run the import machinery.
+    global _UserSubreddit  # noqa: PLW0603
+    if _UserSubreddit is None:
+        from praw.models.reddit.user_subreddit import UserSubreddit  # noqa: PLC0415
+
+        _UserSubreddit = UserSubreddit
+    return _UserSubreddit
+
+
 class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase):
     """A class representing the users of Reddit.
 
@@ -66,6 +80,8 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
 
     STR_FIELD = "name"
 
+    _str_lower = cachedproperty(RedditBase._str_lower.fget)
+
     @classmethod
     def from_data(cls, reddit: praw.Reddit, data: dict[str, Any]) -> Redditor | None:
         """Return an instance of :class:`.Redditor`, or ``None`` from ``data``."""
@@ -125,7 +141,7 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
         """Return the class's kind."""
         return self._reddit.config.kinds["redditor"]
 
-    @property
+    @cachedproperty
     def _path(self) -> str:
         return API_PATH["user"].format(user=self)
 
@@ -145,7 +161,7 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
         Exactly one of ``name``, ``fullname`` or ``_data`` must be provided.
 
         """
-        if sum(1 for value in (name, fullname, _data) if value is not None) != 1:
+        if (name is not None) + (fullname is not None) + (_data is not None) != 1:
             msg = "Exactly one of 'name', 'fullname', or '_data' must be provided."
             raise TypeError(msg)
         if _data:
@@ -162,20 +178,25 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
     def __setattr__(self, name: str, value: Any) -> None:
         """Objectify the subreddit attribute."""
         if name == "subreddit" and value:
-            from praw.models.reddit.user_subreddit import UserSubreddit  # noqa: PLC0415
-
-            value = UserSubreddit(reddit=self._reddit, _data=value)
+            value = _user_subreddit_class()(reddit=self._reddit, _data=value)
         super().__setattr__(name, value)
 
+    def __str__(self) -> str:
+        """Return the redditor's name."""
+        # Read ``name`` directly rather than through ``STR_FIELD``; this is formatted
+        # into the URL of nearly every redditor request
+        return self.name
+
     def _fetch(self) -> None:
         data = self._fetch_data()
         data = data["data"]
-        other = type(self)(self._reddit, _data=data)
-        self.__dict__.update(other.__dict__)
+        for attribute, value in data.items():
+            setattr(self, attribute, value)
         super()._fetch()
 
     def _fetch_info(self) -> tuple[str, dict[str, str], None]:
-        if hasattr(self, "_fullname"):
+        if "name" not in self.__dict__ and hasattr(self, "_fullname"):
+            # Resolve the name only once; later fetches can use it directly
             self.name = self._fetch_username(self._fullname)
         return "user_about", {"user": self.name}, None
 
@@ -337,7 +358,8 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
                 print(trophy.description)
 
         """
-        return list(self._reddit.get(API_PATH["trophies"].format(user=self)))
+        # The response is a TrophyList; return its already objectified list directly
+        return self._reddit.get(API_PATH["trophies"].format(user=self)).trophies
 
     def trust(self) -> None:
         """Add the :class:`.Redditor` to your whitelist of trusted users.
@@ -412,6 +434,12 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
 class RedditorStream:
     """Provides submission and comment streams."""
 
+    __slots__ = ("redditor",)
+
+    def __getstate__(self) -> praw.models.Redditor:
+        """Return the :class:`.Redditor` whose streams this instance provides."""
+        return self.redditor
+
     def __init__(self, redditor: praw.models.Redditor) -> None:
         """Initialize a :class:`.RedditorStream` instance.
 
@@ -420,6 +448,10 @@ class RedditorStream:
         """
         self.redditor = redditor
 
+    def __setstate__(self, state: praw.models.Redditor) -> None:
+        """Reattach the unpickled :class:`.Redditor` to this instance."""
+        self.redditor = state
+
     def comments(self, **stream_options: str | int | dict[str, str]) -> Iterator[praw.models.Comment]:
         """Yield new comments as they become available.
 
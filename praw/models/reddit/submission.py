@@ -16,6 +16,7 @@ from praw.models.comment_forest import CommentForest
 from praw.models.listing.listing import Listing
 from praw.models.listing.mixins import SubmissionListingMixin
 from praw.models.reddit.base import RedditBase
+from praw.models.reddit.comment import Comment
 from praw.models.reddit.mixins import FullnameMixin, ModNoteMixin, ThingModerationMixin, UserContentMixin
 from praw.models.reddit.poll import PollData
 from praw.models.reddit.redditor import Redditor
@@ -619,6 +620,21 @@ class Submission(SubmissionListingMixin, UserContentMixin, FullnameMixin, Reddit
             )
         super().__setattr__(attribute, value)
 
+    def _bulk_register(self, comments: list[praw.models.Comment | praw.models.MoreComments]) -> None:
+        """Associate ``comments``, and all of their replies, with this submission.
+
+        The trees are walked once and ``_comments_by_id`` is updated in a single call.
+
+        """
+        comments_by_id = {}
+        for comment in Comment._iter_comment_tree(comments):
+            if isinstance(comment, Comment):
+                comment.__dict__["_submission"] = self  # Skip Comment.__setattr__
+                comments_by_id[comment.fullname] = comment
+            else:
+                comment.submission = self
+        self._comments_by_id.update(comments_by_id)
+
     def _chunk(
         self,
         *,
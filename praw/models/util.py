@@ -39,6 +39,7 @@ def stream_generator(
     attribute_name: str = "fullname",
     continue_after_id: str | None = None,
     exclude_before: bool = False,
+    max_delay: int = 16,
     pause_after: int | None = None,
     skip_existing: bool = False,
     **function_kwargs: Any,
@@ -50,6 +51,8 @@ def stream_generator(
     :param attribute_name: The field to use as an ID (default: ``"fullname"``).
     :param exclude_before: When ``True`` does not pass ``params`` to ``function``
         (default: ``False``).
+    :param max_delay: The maximum base delay, in seconds, between subsequent responses
+        that contain no new results (default: ``16``).
     :param pause_after: An integer representing the number of requests that result in no
         new items before this function yields ``None``, effectively introducing a pause
         into the stream. A negative value yields ``None`` after items from a single
@@ -69,8 +72,8 @@ def stream_generator(
 
         This function internally uses an exponential delay with jitter between
         subsequent responses that contain no new results, up to a maximum delay of just
-        over 16 seconds. In practice, that means that the time before pause for
-        ``pause_after=N+1`` is approximately twice the time before pause for
+        over ``max_delay`` seconds. In practice, that means that the time before pause
+        for ``pause_after=N+1`` is approximately twice the time before pause for
         ``pause_after=N``.
 
     For example, to create a stream of comment replies, try:
@@ -121,9 +124,18 @@ def stream_generator(
                 continue
             print(comment)
 
+    To reduce the number of requests made while watching a redditor who posts
+    infrequently, allow the delay to grow up to five minutes:
+
+    .. code-block:: python
+
+        redditor = reddit.redditor("spez")
+        for comment in redditor.stream.comments(max_delay=300):
+            print(comment)
+
     """
     before_attribute = continue_after_id
-    exponential_counter = ExponentialCounter(max_counter=16)
+    exponential_counter = ExponentialCounter(max_counter=max_delay)
     seen_attributes = BoundedSet(301)
     without_before_counter = 0
     responses_without_new = 0
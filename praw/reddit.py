@@ -815,6 +815,12 @@ class Reddit:
 
         Either ``name`` or ``fullname`` can be provided, but not both.
 
+        .. note::
+
+            Resolving a ``fullname`` costs an additional request the first time the
+            redditor is fetched. To look up many redditors by fullname use
+            :meth:`.partial_redditors`, which resolves up to 100 per request.
+
         """
         return models.Redditor(self, name=name, fullname=fullname)
 
@@ -36,12 +36,13 @@ class cachedproperty:  # noqa: N801
         if obj is None:
             return self
 
-        value = obj.__dict__[self.func.__name__] = self.func(obj)
+        value = obj.__dict__[self.attrname] = self.func(obj)
         return value
 
     def __init__(self, func: Callable[[Any], Any], doc: str | None = None) -> None:
         """Initialize a :class:`.cachedproperty` instance."""
         self.func = self.__wrapped__ = func
+        self.attrname = func.__name__
 
         if doc is None:
             doc = func.__doc__
@@ -50,3 +51,7 @@ class cachedproperty:  # noqa: N801
     def __repr__(self) -> str:
         """Return an object initialization representation of the instance."""
         return f"<{self.__class__.__name__} {self.func}>"
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Cache values under the name the property is assigned to."""
+        self.attrname = name
@@ -1,8 +1,22 @@
-from praw.models.listing.listing import ModmailConversationsListing, ModNoteListing
+from praw.models.listing.listing import (
+    FlairListing,
+    ModmailConversationsListing,
+    ModNoteListing,
+)
 
 from ... import UnitTest
 
 
+class TestFlairListing(UnitTest):
+    def test_child_attribute(self, reddit):
+        listing = FlairListing(reddit, _data={"users": ["spez", "bboe"]})
+        assert len(listing) == 2
+        assert listing[1] == "bboe"
+        listing.users = ["spez"]
+        assert len(listing) == 1
+        assert list(listing) == ["spez"]
+
+
 class TestModNoteListing(UnitTest):
     def test_has_next_page(self, reddit):
         assert (
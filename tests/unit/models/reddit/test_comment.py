@@ -1,12 +1,33 @@
 import pickle
+from unittest import mock
 
 import pytest
 
 from praw.exceptions import ClientException
-from praw.models import Comment
+from praw.models import Comment, Submission
 
 from ... import UnitTest
 
+COMMENT_WITH_REPLY_DATA = {
+    "id": "dummy",
+    "link_id": "t3_2gmzqe",
+    "replies": {
+        "kind": "Listing",
+        "data": {
+            "children": [
+                {
+                    "kind": "t1",
+                    "data": {
+                        "id": "reply",
+                        "link_id": "t3_2gmzqe",
+                        "parent_id": "t1_dummy",
+                    },
+                }
+            ]
+        },
+    },
+}
+
 
 class TestComment(UnitTest):
     def test_attribute_error(self, reddit):
@@ -96,12 +117,45 @@ class TestComment(UnitTest):
             with pytest.raises(ClientException):
                 Comment.id_from_url(url)
 
+    def test_is_root(self, reddit):
+        comment = Comment(reddit, _data={"id": "dummy", "parent_id": "t3_2gmzqe"})
+        assert comment.is_root
+        comment = Comment(reddit, _data={"id": "dummy", "parent_id": "t1_cklhv0f"})
+        assert not comment.is_root
+
+    def test_parent(self, reddit):
+        submission = Submission(reddit, id="2gmzqe")
+        root = Comment(reddit, _data={"id": "root", "parent_id": "t3_2gmzqe"})
+        child = Comment(reddit, _data={"id": "child", "parent_id": "t1_root"})
+        orphan = Comment(reddit, _data={"id": "orphan", "parent_id": "t1_other"})
+        submission._bulk_register([root, child, orphan])
+        assert root.parent() is submission
+        assert child.parent() is root
+        parent = orphan.parent()
+        assert parent == "other"
+        assert parent._submission is submission
+
     def test_pickle(self, reddit):
         comment = Comment(reddit, _data={"id": "dummy"})
         for level in range(pickle.HIGHEST_PROTOCOL + 1):
             other = pickle.loads(pickle.dumps(comment, protocol=level))
             assert comment == other
 
+    def test_replies(self, reddit):
+        comment = Comment(reddit, _data=COMMENT_WITH_REPLY_DATA)
+        assert comment.replies[0] == "reply"
+        assert comment.replies is comment.replies
+        comment.replies = ""
+        assert len(comment.replies) == 0
+
+    def test_replies__after_edit(self, reddit):
+        comment = Comment(reddit, _data=COMMENT_WITH_REPLY_DATA)
+        assert len(comment.replies) == 1
+        updated = Comment(reddit, _data={"id": "dummy", "replies": ""})
+        with mock.patch.object(reddit, "post", return_value=[updated]):
+            comment.edit("edited")
+        assert len(comment.replies) == 0
+
     def test_repr(self, reddit):
         comment = Comment(reddit, id="dummy")
         assert repr(comment) == "Comment(id='dummy')"
@@ -110,6 +164,15 @@ class TestComment(UnitTest):
         comment = Comment(reddit, _data={"id": "dummy"})
         assert str(comment) == "dummy"
 
+    def test_submission_setter(self, reddit):
+        comment = Comment(reddit, _data=COMMENT_WITH_REPLY_DATA)
+        submission = Submission(reddit, id="2gmzqe")
+        comment.submission = submission
+        reply = comment.replies[0]
+        assert comment._submission is submission
+        assert reply._submission is submission
+        assert submission._comments_by_id == {"t1_dummy": comment, "t1_reply": reply}
+
     def test_unset_hidden_attribute_does_not_fetch(self, reddit):
         comment = Comment(reddit, _data={"id": "dummy"})
         assert comment._fetched
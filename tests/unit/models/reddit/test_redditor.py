@@ -55,6 +55,11 @@ class TestRedditor(UnitTest):
         assert redditor1 == "dummy1"
         assert redditor2 == "dummy1"
 
+    def test_fetch_info__name_already_resolved(self, reddit):
+        redditor = Redditor(reddit, fullname="t2_dummy")
+        redditor.name = "dummy"
+        assert redditor._fetch_info() == ("user_about", {"user": "dummy"}, None)
+
     def test_fullname(self, reddit):
         redditor = Redditor(reddit, _data={"name": "name", "id": "dummy"})
         assert redditor.fullname == "t2_dummy"
@@ -76,6 +81,13 @@ class TestRedditor(UnitTest):
             other = pickle.loads(pickle.dumps(redditor, protocol=level))
             assert redditor == other
 
+    def test_pickle__with_stream(self, reddit):
+        redditor = Redditor(reddit, _data={"name": "name", "id": "dummy"})
+        assert redditor.stream.redditor is redditor
+        for level in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(redditor, protocol=level))
+            assert other.stream.redditor is other
+
     def test_repr(self, reddit):
         redditor = Redditor(reddit, name="RedditorName")
         assert repr(redditor) == "Redditor(name='RedditorName')"
@@ -3,7 +3,7 @@ import pickle
 import pytest
 
 from praw.exceptions import ClientException
-from praw.models import Submission
+from praw.models import Comment, MoreComments, Submission
 
 from ... import UnitTest
 
@@ -28,6 +28,18 @@ class TestSubmission(UnitTest):
         submission.additional_fetch_params = True
         assert caplog.records == []
 
+    def test_bulk_register(self, reddit):
+        submission = Submission(reddit, id="2gmzqe")
+        reply = Comment(reddit, _data={"id": "reply", "parent_id": "t1_dummy"})
+        comment = Comment(reddit, _data={"id": "dummy", "parent_id": "t3_2gmzqe"})
+        more = MoreComments(reddit, _data={"count": 1, "children": ["other"]})
+        comment._replies = [reply]
+        submission._bulk_register([comment, more])
+        assert submission._comments_by_id == {"t1_dummy": comment, "t1_reply": reply}
+        assert comment.submission is submission
+        assert reply.submission is submission
+        assert more.submission is submission
+
     @pytest.mark.filterwarnings("error", category=UserWarning)
     def test_comment_sort_warning(self, reddit):
         with pytest.raises(UserWarning) as excinfo:
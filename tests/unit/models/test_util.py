@@ -1,6 +1,7 @@
 """Test praw.models.util."""
 
 from collections import namedtuple
+from unittest import mock
 
 from praw.models.util import (
     BoundedSet,
@@ -136,6 +137,17 @@ class TestStream(UnitTest):
             assert thing.fullname == expected_fullname, thing
             expected_fullname += 1
 
+    @mock.patch("time.sleep")
+    def test_max_delay(self, mock_sleep):
+        stream = stream_generator(
+            lambda limit, **kwargs: [], max_delay=64, pause_after=8
+        )
+        assert next(stream) is None
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 8
+        assert delays[-1] >= 64 * (1 - 1.0 / 32)
+        assert max(delays) <= 64 * (1 + 1.0 / 32)
+
     def test_stream(
         self,
     ):
@@ -1,3 +1,6 @@
+import pickle
+import sys
+
 import pytest
 
 from praw.exceptions import (
@@ -144,6 +147,26 @@ class TestRedditErrorItem:
         error2 = RedditErrorItem(**resp)
         assert hash(error) == hash(error2)
 
+    def test_intern(self):
+        error_type = "".join(["BAD_", "SOMETHING"])
+        field = "".join(["some_", "field"])
+        error = RedditErrorItem(error_type, field=field)
+        assert error.error_type is sys.intern("BAD_SOMETHING")
+        assert error.field is sys.intern("some_field")
+        assert RedditErrorItem(error_type).field is None
+        assert RedditErrorItem(error_type, field="").field == ""
+
+    def test_pickle(self):
+        error = RedditErrorItem(
+            "BAD_SOMETHING", field="some_field", message="invalid something"
+        )
+        for level in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(error, protocol=level))
+            assert error == other
+            assert other.error_type is sys.intern("BAD_SOMETHING")
+            assert other.field is sys.intern("some_field")
+        assert not hasattr(error, "__dict__")
+
     def test_property(self):
         error = RedditErrorItem(
             "BAD_SOMETHING", field="some_field", message="invalid something"
@@ -17,6 +17,11 @@ class TestCachedProperty(UnitTest):
 
         ten = cachedproperty(ten, doc="Return 10.")
 
+        def _eleven(self):
+            return 11
+
+        eleven = cachedproperty(_eleven)
+
     def test_doc(self):
         assert self.Klass.nine.__doc__ == "Return 9."
         assert self.Klass.ten.__doc__ == "Return 10."
@@ -29,6 +34,9 @@ class TestCachedProperty(UnitTest):
         assert "ten" not in klass.__dict__
         assert klass.ten == 10
         assert "ten" in klass.__dict__
+        assert klass.eleven == 11
+        assert "eleven" in klass.__dict__
+        assert "_eleven" not in klass.__dict__
 
     def test_repr(self):
         klass = self.Klass()